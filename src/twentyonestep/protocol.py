@@ -1,7 +1,261 @@
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional
+
+import numpy as np
 from openmm import MonteCarloBarostat, unit
 from openmm.app import Simulation
 from openmm.unit import Quantity
 
+logger = logging.getLogger(__name__)
+
+_NoneType = type(None)
+
+_DEFAULT_MAX_PRESSURE = 50_000 * unit.bar
+_DEFAULT_MAX_TEMPERATURE = 600 * unit.kelvin
+_300K = 300 * unit.kelvin
+_1BAR = 1 * unit.bar
+_5PS = 5 * unit.picosecond
+_10PS = 10 * unit.picosecond
+_50PS = 50 * unit.picosecond
+_100PS = 100 * unit.picosecond
+_800PS = 800 * unit.picosecond
+
+# (argument name, accepted type(s), description used in the error message,
+#  unit a Quantity value has to be compatible with)
+_MDSTEP_ARG_TYPES = (
+    ("simulation", Simulation, "openmm.app.Simulation", None),
+    ("temperature", Quantity, "openmm.unit.Quantity", unit.kelvin),
+    ("pressure", (Quantity, _NoneType), "openmm.unit.Quantity or None", unit.bar),
+    ("time", Quantity, "openmm.unit.Quantity", unit.picosecond),
+    ("name", str, "str", None),
+    ("steps", (int, _NoneType), "int or None", None),
+)
+
+_PROTOCOL_ARG_TYPES = (
+    ("simulation", Simulation, "openmm.app.Simulation", None),
+    ("max_pressure", Quantity, "openmm.unit.Quantity", unit.bar),
+    ("max_temperature", Quantity, "openmm.unit.Quantity", unit.kelvin),
+)
+
+# Record layout of TwentyOneStepProtocol.schedule_array; NaN pressure means NVT.
+_SCHEDULE_DTYPE = np.dtype(
+    [("temperature_K", "f8"), ("pressure_bar", "f8"), ("time_ps", "f8")]
+)
+
+# Stage table of the Larsen et al. (2011) protocol: (name, temperature, pressure,
+# time). A plain float temperature or pressure is a fraction of the
+# protocol maximum; a pressure of None runs the stage without a barostat (NVT).
+# The table is treated as a constant: templates built from it are cached by
+# _build_schedule_template, whose key does not include the table (Quantities are
+# not hashable). To customise one protocol, edit its `schedule` list instead; if
+# the table itself is replaced, call _build_schedule_template.cache_clear().
+_SCHEDULE_TABLE = (
+    ("md1", 1.0, None, _50PS),
+    ("md2", _300K, None, _50PS),
+    ("md3", _300K, 0.02, _50PS),
+    ("md4", 1.0, None, _50PS),
+    ("md5", _300K, None, _100PS),
+    ("md6", _300K, 0.6, _50PS),
+    ("md7", 1.0, None, _50PS),
+    ("md8", _300K, None, _100PS),
+    ("md9", _300K, 1.0, _50PS),
+    ("md10", 1.0, None, _50PS),
+    ("md11", _300K, None, _100PS),
+    ("md12", _300K, 0.5, _5PS),
+    ("md13", 1.0, None, _5PS),
+    ("md14", _300K, None, _10PS),
+    ("md15", _300K, 0.1, _5PS),
+    ("md16", 1.0, None, _5PS),
+    ("md17", _300K, None, _10PS),
+    ("md18", _300K, 0.01, _5PS),
+    ("md19", 1.0, None, _5PS),
+    ("md20", _300K, None, _10PS),
+    ("md21", _300K, _1BAR, _800PS),
+)
+
+
+def _resolve(value, maximum: Quantity):
+    """
+    Resolves a schedule table entry against the protocol maximum.
+
+    Args:
+        value: None, an absolute Quantity, or a float fraction of `maximum`.
+        maximum: The protocol's maximum temperature or pressure.
+
+    Returns:
+        None, the Quantity itself, or the scaled maximum.
+    """
+
+    if value is None or isinstance(value, Quantity):
+        return value
+
+    return maximum if value == 1.0 else maximum * value
+
+
+@functools.lru_cache(maxsize=32)
+def _build_schedule_template(
+    max_pressure_bar: float, max_temperature_k: float
+) -> tuple:
+    """
+    Builds the stage entries of the schedule for the given maxima.
+
+    Results are cached, so protocols sharing the same maxima reuse one set of
+    stage Quantities. The maxima are passed as plain numbers in bar and kelvin
+    to give the cache a value-based key. The key does not cover _SCHEDULE_TABLE,
+    so the cache must be cleared (cache_clear()) after replacing the table.
+
+    Args:
+        max_pressure_bar: The peak pressure in bar.
+        max_temperature_k: The maximum temperature in kelvin.
+
+    Returns:
+        A tuple of read-only mappings with the 'temperature', 'pressure', 'time'
+        and 'name' of each stage.
+    """
+
+    max_pressure = max_pressure_bar * unit.bar
+    max_temperature = max_temperature_k * unit.kelvin
+
+    return tuple(
+        MappingProxyType(
+            {
+                "temperature": _resolve(temperature, max_temperature),
+                "pressure": _resolve(pressure, max_pressure),
+                "time": time,
+                "name": name,
+            }
+        )
+        for name, temperature, pressure, time in _SCHEDULE_TABLE
+    )
+
+
+def _sync_barostat(
+    simulation: Simulation,
+    pressure: Optional[Quantity],
+    temperature: Quantity,
+    frequency: int,
+    update_context: bool = True,
+) -> bool:
+    """
+    Brings the System to at most one MonteCarloBarostat configured for the
+    given conditions, applying the smallest change possible.
+
+    Surplus barostats are removed. If the System has none and pressure is not
+    None, one is added. An existing barostat is otherwise updated in place:
+    it is disabled (frequency 0) if pressure is None, and otherwise its pressure
+    and temperature are written both as defaults and as Context parameters.
+
+    Updating in place relies on OpenMM reading the barostat frequency from the
+    System force at every step and the pressure and temperature from the
+    Context parameters, so no reinitialization is needed. This behaviour is
+    verified on the Reference platform with OpenMM 8.1.1 and 8.6.1; 8.1 is the
+    minimum version declared in pyproject.toml.
+
+    Args:
+        simulation: The Simulation whose System and Context are configured.
+        pressure: The target pressure, or None for no pressure coupling.
+        temperature: The target temperature of the barostat.
+        frequency: The frequency for the barostat moves.
+        update_context: If False, the Context parameters are left untouched. For
+            callers that reinitialize the Context right afterwards, whose Context
+            may not contain the barostat yet. Defaults to True.
+
+    Returns:
+        True if forces were added to or removed from the System and the Context
+        has to be reinitialized, False otherwise.
+    """
+
+    system = simulation.system
+    indices = [
+        i
+        for i in range(system.getNumForces())
+        if isinstance(system.getForce(i), MonteCarloBarostat)
+    ]
+    changed = len(indices) > 1
+
+    # Walk backwards so removals do not shift the indices still to visit.
+    for i in reversed(indices[1:]):
+        system.removeForce(i)
+
+    if not indices:
+        if pressure is None:
+            return False
+
+        system.addForce(MonteCarloBarostat(pressure, temperature, frequency))
+        return True
+
+    barostat = system.getForce(indices[0])
+
+    if pressure is None:
+        barostat.setFrequency(0)
+        return changed
+
+    barostat.setDefaultPressure(pressure)
+    barostat.setDefaultTemperature(temperature)
+    barostat.setFrequency(frequency)
+
+    if not update_context:
+        return changed
+
+    # Always write the Context parameters: they can differ from the System
+    # defaults, e.g. if the defaults were edited without a reinitialize.
+    simulation.context.setParameter(
+        MonteCarloBarostat.Pressure(), pressure.value_in_unit(unit.bar)
+    )
+    simulation.context.setParameter(
+        MonteCarloBarostat.Temperature(), temperature.value_in_unit(unit.kelvin)
+    )
+
+    return changed
+
+
+def _require_unit(quantity: Quantity, expected_unit: unit.Unit, arg_name: str):
+    """
+    Checks that a Quantity has units compatible with the expected unit.
+
+    Args:
+        quantity: The Quantity to check.
+        expected_unit: A unit of the required dimension (e.g. unit.kelvin).
+        arg_name: The argument name used in the error message.
+
+    Raises:
+        TypeError: If the units of `quantity` are not compatible.
+    """
+
+    if not quantity.unit.is_compatible(expected_unit):
+        raise TypeError(
+            f"Argument '{arg_name}' should have units compatible with {expected_unit}"
+        )
+
+
+def _validate_types(arg_types: tuple, values: tuple):
+    """
+    Checks argument values against a table of expected types and units in a
+    single pass.
+
+    Args:
+        arg_types: Tuples of (argument name, accepted type(s), description,
+            expected unit or None).
+        values: The argument values, in the same order as `arg_types`.
+
+    Raises:
+        TypeError: For the first argument whose type or units are not accepted.
+    """
+
+    for (arg_name, accepted, description, expected_unit), value in zip(
+        arg_types, values
+    ):
+        if not isinstance(value, accepted):
+            raise TypeError(
+                f"Argument '{arg_name}' should be an instance of {description}"
+            )
+
+        if expected_unit is not None and value is not None:
+            _require_unit(value, expected_unit, arg_name)
+
 
 class MDStep:
     """
@@ -12,6 +266,8 @@ class MDStep:
     including temperature and pressure control (Barostat).
     """
 
+    __slots__ = ("simulation", "temperature", "pressure", "time", "name", "steps")
+
     def __init__(
         self,
         simulation: Simulation,
@@ -19,6 +275,7 @@ class MDStep:
         pressure: Quantity,
         time: Quantity,
         name: str,
+        steps: Optional[int] = None,
     ):
         """
         Initializes an MD step configuration.
@@ -30,28 +287,17 @@ class MDStep:
                 If None, no barostat will be applied (NVT ensemble).
             time: The total duration of the stage (e.g., 50*unit.picosecond).
             name: A descriptive name for the stage (e.g., 'equilibration_NPT').
+            steps: The number of integration steps covering `time`. If None, it is
+                derived from the integrator's step size.
 
         Raises:
-            TypeError: If any argument type is incorrect.
+            TypeError: If any argument type is incorrect or a Quantity has
+                units of the wrong dimension.
         """
 
-        if any(not isinstance(arg, Quantity) for arg in [temperature, time]):
-            raise TypeError(
-                "Arguments 'temperature' and 'time' should be instances of openmm.unit.Quantity"
-            )
-
-        if not isinstance(simulation, Simulation):
-            raise TypeError(
-                "Argument 'simulation' should be an instance of openmm.app.Simulation"
-            )
-
-        if pressure is not None and not isinstance(pressure, Quantity):
-            raise TypeError(
-                "Argument 'pressure' should be an instance of openmm.unit.Quantity or None"
-            )
-
-        if not isinstance(name, str):
-            raise TypeError("Argument 'name' should be an instance of str")
+        _validate_types(
+            _MDSTEP_ARG_TYPES, (simulation, temperature, pressure, time, name, steps)
+        )
 
         self.simulation = simulation
         self.temperature = temperature
@@ -59,52 +305,68 @@ class MDStep:
         self.time = time
         self.name = name
 
-        timestep = simulation.integrator.getStepSize()
-        self.steps = int(round(time / timestep))
+        if steps is None:
+            time_ps = time.value_in_unit(unit.picosecond)
+            timestep_ps = simulation.integrator.getStepSize().value_in_unit(
+                unit.picosecond
+            )
+            steps = int(round(time_ps / timestep_ps))
+
+        self.steps = steps
 
-    def run(self, frequency=500):
+    def run(self, frequency=500, previous_temperature: Optional[Quantity] = None):
         """
         Executes the molecular dynamics stage.
 
         This method sets the new temperature, initializes velocities,
         configures the barostat (if pressure is not None), and runs the steps.
+        The Context is only reinitialized if a barostat had to be added.
 
         Args:
             frequency: The frequency (in steps) for the Monte Carlo Barostat moves.
                 Only used if self.pressure is not None. Defaults to 500.
+            previous_temperature: The temperature of the stage run just before this
+                one. If it equals self.temperature, the thermostat is left as is and
+                the velocities carry over instead of being redrawn. Defaults to None.
         """
 
-        print(f"\n=== Starting stage {self.name} ===")
-        print(f"Temperature: {self.temperature}, Pressure: {self.pressure}")
-        print(f"Time: {self.time}")
+        logger.info(
+            "Starting stage %s (temperature: %s, pressure: %s, time: %s)",
+            self.name,
+            self.temperature,
+            self.pressure,
+            self.time,
+        )
 
-        self.simulation.integrator.setTemperature(self.temperature)
-        self.simulation.context.setVelocitiesToTemperature(self.temperature)
-        self._set_barostat(frequency)
-        self.simulation.context.reinitialize(preserveState=True)
+        if self.temperature != previous_temperature:
+            self.simulation.integrator.setTemperature(self.temperature)
+            self.simulation.context.setVelocitiesToTemperature(self.temperature)
+
+        if self._set_barostat(frequency):
+            self.simulation.context.reinitialize(preserveState=True)
         self.simulation.step(self.steps)
 
-        print(f"Completed stage {self.name}")
+        logger.info("Completed stage %s", self.name)
 
-    def _set_barostat(self, frequency: int):
+    def _set_barostat(self, frequency: int) -> bool:
         """
-        Removes any existing MonteCarloBarostat and adds a new one if
-        self.pressure is not None.
+        Configures the System's MonteCarloBarostat for this stage.
+
+        The barostat is disabled (frequency 0) if self.pressure is None and is
+        otherwise updated in place, so the Context only has to be reinitialized
+        if barostats had to be added or removed.
 
         Args:
             frequency: The frequency for the barostat moves.
-        """
 
-        system = self.simulation.system
-
-        for i, force in enumerate(list(system.getForces())):
-            if isinstance(force, MonteCarloBarostat):
-                system.removeForce(i)
+        Returns:
+            True if the System's forces were changed and the Context has to be
+            reinitialized, False otherwise.
+        """
 
-        if self.pressure is not None:
-            system.addForce(
-                MonteCarloBarostat(self.pressure, self.temperature, frequency)
-            )
+        return _sync_barostat(
+            self.simulation, self.pressure, self.temperature, frequency
+        )
 
 
 class TwentyOneStepProtocol:
@@ -123,12 +385,14 @@ class TwentyOneStepProtocol:
     def __init__(
         self,
         simulation: Simulation,
-        max_pressure: Quantity = 50_000 * unit.bar,
-        max_temperature: Quantity = 600 * unit.kelvin,
+        max_pressure: Quantity = _DEFAULT_MAX_PRESSURE,
+        max_temperature: Quantity = _DEFAULT_MAX_TEMPERATURE,
     ):
         """
         Initializes the protocol manager and generates the schedule.
 
+        The Simulation is not modified here; barostat setup happens in run().
+
         Args:
             simulation: The OpenMM Simulation object to be used for all steps.
             max_pressure: The maximum pressure to be used in the ramping stages
@@ -136,181 +400,184 @@ class TwentyOneStepProtocol:
             max_temperature: The maximum temperature for the equilibration. Defaults to 600 K.
 
         Raises:
-            TypeError: If argument types are incorrect.
+            TypeError: If argument types are incorrect or a Quantity has units
+                of the wrong dimension.
         """
 
-        if not isinstance(simulation, Simulation):
-            raise TypeError(
-                "Argument 'simulation' should be an instance of openmm.app.Simulation"
-            )
-
-        if not isinstance(max_pressure, Quantity):
-            raise TypeError(
-                "Argument 'max_pressure' should be an instance of openmm.unit.Quantity"
-            )
-
-        if not isinstance(max_temperature, Quantity):
-            raise TypeError(
-                "Argument 'max_temperature' should be an instance of openmm.unit.Quantity"
-            )
+        _validate_types(
+            _PROTOCOL_ARG_TYPES, (simulation, max_pressure, max_temperature)
+        )
 
         self.simulation = simulation
+        self.max_pressure = max_pressure
+        self.max_temperature = max_temperature
         self.schedule: list[dict] = []
-        self._generate_schedule(max_pressure, max_temperature)
+        self._steps: list[MDStep] = []
+        self._steps_built_from: tuple = ()
+        self._generate_schedule(self.max_pressure, self.max_temperature)
 
-    def _generate_schedule(
-        self, max_pressure: Quantity, max_temperature: Quantity = 600 * unit.kelvin
-    ):
+    def _generate_schedule(self, max_pressure: Quantity, max_temperature: Quantity):
         """
         Generates the 21-stage pressure ramping schedule based on a
-        maximum pressure value.
+        maximum pressure value and builds the MDStep executors for it.
+
+        Each stage gets a precomputed integer 'steps' entry (see _build_steps).
 
         Args:
             max_pressure: The peak pressure value used to scale other pressure steps.
-            max_temperature: The maximum temperature for the equilibration. Defaults to 600 K.
+            max_temperature: The maximum temperature for the equilibration.
         """
 
-        self.schedule = [
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 50 * unit.picosecond,
-                "name": "md1",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 50 * unit.picosecond,
-                "name": "md2",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure * 0.02,
-                "time": 50 * unit.picosecond,
-                "name": "md3",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 50 * unit.picosecond,
-                "name": "md4",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 100 * unit.picosecond,
-                "name": "md5",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure * 0.6,
-                "time": 50 * unit.picosecond,
-                "name": "md6",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 50 * unit.picosecond,
-                "name": "md7",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 100 * unit.picosecond,
-                "name": "md8",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure,
-                "time": 50 * unit.picosecond,
-                "name": "md9",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 50 * unit.picosecond,
-                "name": "md10",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 100 * unit.picosecond,
-                "name": "md11",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure * 0.5,
-                "time": 5 * unit.picosecond,
-                "name": "md12",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 5 * unit.picosecond,
-                "name": "md13",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 10 * unit.picosecond,
-                "name": "md14",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure * 0.1,
-                "time": 5 * unit.picosecond,
-                "name": "md15",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 5 * unit.picosecond,
-                "name": "md16",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 10 * unit.picosecond,
-                "name": "md17",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": max_pressure * 0.01,
-                "time": 5 * unit.picosecond,
-                "name": "md18",
-            },
-            {
-                "temperature": max_temperature,
-                "pressure": None,
-                "time": 5 * unit.picosecond,
-                "name": "md19",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": None,
-                "time": 10 * unit.picosecond,
-                "name": "md20",
-            },
-            {
-                "temperature": 300 * unit.kelvin,
-                "pressure": 1 * unit.bar,
-                "time": 800 * unit.picosecond,
-                "name": "md21",
-            },
+        template = _build_schedule_template(
+            max_pressure.value_in_unit(unit.bar),
+            max_temperature.value_in_unit(unit.kelvin),
+        )
+        self.schedule = [dict(task) for task in template]
+
+        self._build_steps()
+
+    @property
+    def schedule_array(self) -> np.ndarray:
+        """
+        The current schedule as a NumPy structured array with the fields
+        'temperature_K', 'pressure_bar' (NaN for NVT stages) and 'time_ps'.
+
+        The array is computed from self.schedule on every access, so it always
+        reflects edits to the schedule; changing the array does not change the
+        schedule.
+        """
+
+        return np.array(
+            [
+                (
+                    task["temperature"].value_in_unit(unit.kelvin),
+                    (
+                        np.nan
+                        if task["pressure"] is None
+                        else task["pressure"].value_in_unit(unit.bar)
+                    ),
+                    task["time"].value_in_unit(unit.picosecond),
+                )
+                for task in self.schedule
+            ],
+            dtype=_SCHEDULE_DTYPE,
+        )
+
+    def _timestep_ps(self) -> float:
+        """
+        Returns the integrator's current step size in picoseconds.
+        """
+
+        return self.simulation.integrator.getStepSize().value_in_unit(unit.picosecond)
+
+    def _build_steps(self):
+        """
+        Builds the MDStep executors for the current schedule.
+
+        The 'steps' entry of every stage is (re)computed from its 'time' and the
+        integrator's step size, read once. A copy of the schedule and the step
+        size is kept so that run() can tell whether they changed since.
+        """
+
+        timestep_ps = self._timestep_ps()
+
+        for task in self.schedule:
+            time = task.get("time")
+            if isinstance(time, Quantity):
+                time_ps = time.value_in_unit(unit.picosecond)
+                task["steps"] = int(round(time_ps / timestep_ps))
+
+        self._steps = [
+            MDStep(simulation=self.simulation, **task) for task in self.schedule
         ]
+        self._steps_built_from = (
+            timestep_ps,
+            [dict(task) for task in self.schedule],
+        )
+
+    def _schedule_changed(self) -> bool:
+        """
+        Checks whether the schedule or the integrator's step size changed since
+        the MDStep executors were last built.
+        """
+
+        return (self._timestep_ps(), self.schedule) != self._steps_built_from
+
+    def _fuse_equivalent_steps(self) -> list[MDStep]:
+        """
+        Merges runs of consecutive stages that share the same temperature and
+        pressure into single MDStep executors covering their combined time.
+
+        Returns:
+            The list of (possibly merged) MDStep executors, in schedule order.
+        """
+
+        groups: list[list[MDStep]] = []
+
+        for step in self._steps:
+            if (
+                groups
+                and step.temperature == groups[-1][0].temperature
+                and step.pressure == groups[-1][0].pressure
+            ):
+                groups[-1].append(step)
+            else:
+                groups.append([step])
+
+        fused: list[MDStep] = []
+
+        for group in groups:
+            if len(group) == 1:
+                fused.append(group[0])
+                continue
+
+            total_time = group[0].time
+            for member in group[1:]:
+                total_time = total_time + member.time
+
+            fused.append(
+                MDStep(
+                    simulation=self.simulation,
+                    temperature=group[0].temperature,
+                    pressure=group[0].pressure,
+                    time=total_time,
+                    name="+".join(member.name for member in group),
+                    steps=sum(member.steps for member in group),
+                )
+            )
 
-    def run(self, barostat_frequency: int = 500):
+        return fused
+
+    def run(self, barostat_frequency: int = 500, fuse_equivalent: bool = False):
         """
         Executes all MD stages defined in the internal schedule using the
-        MDStep executor class.
+        MDStep executors prepared during schedule generation.
+
+        Before the first stage, the System is left with a single, disabled
+        MonteCarloBarostat and the Context is reinitialized once, so that every
+        Context built on the System contains it. The stages then reconfigure
+        this barostat in place without further reinitialization.
+
+        The stages are taken from self.schedule, a list of dicts with the keys
+        'temperature', 'pressure', 'time' and 'name' that may be edited before
+        calling run(). If the schedule or the integrator's step size changed
+        since the MDStep executors were last built, they are rebuilt; the
+        'steps' entries are always derived from 'time'.
 
         Args:
             barostat_frequency: The frequency for the Monte Carlo Barostat moves.
                 Defaults to 500.
+            fuse_equivalent: If True, consecutive stages with identical temperature
+                and pressure are run as one stage (named e.g. 'md1+md2'), saving
+                the stage setup between them. In the published schedule no two
+                adjacent stages share both, so stages only merge when
+                max_temperature equals 300 K (e.g. md1+md2) or self.schedule has
+                been edited to contain such neighbours. Defaults to False.
 
         Raises:
-            TypeError: If barostat_frequency is not an integer.
-            RuntimeError: If the schedule list is empty (should not happen after init).
+            TypeError: If barostat_frequency is not an integer, or if an edited
+                schedule entry has arguments of the wrong type.
+            RuntimeError: If the schedule list is empty.
         """
 
         if not isinstance(barostat_frequency, int):
@@ -323,10 +590,139 @@ class TwentyOneStepProtocol:
                 "Schedule is empty. Probably an error ocured during schedule generation."
             )
 
-        print(f"\n--- Protocol Starting: {len(self.schedule)} Stages ---")
+        if self._schedule_changed():
+            self._build_steps()
 
-        for task in self.schedule:
-            step = MDStep(simulation=self.simulation, **task)
-            step.run(frequency=barostat_frequency)
+        steps = self._fuse_equivalent_steps() if fuse_equivalent else self._steps
+
+        logger.info("Protocol starting: %d stages", len(steps))
+
+        _sync_barostat(self.simulation, _1BAR, _300K, 0, update_context=False)
+        self.simulation.context.reinitialize(preserveState=True)
+
+        previous_temperature = None
+
+        for step in steps:
+            step.run(
+                frequency=barostat_frequency,
+                previous_temperature=previous_temperature,
+            )
+            previous_temperature = step.temperature
+
+        logger.info("Protocol completed successfully")
+
+    def run_batch(
+        self,
+        positions_list: list,
+        barostat_frequency: int = 500,
+        fuse_equivalent: bool = False,
+    ) -> list:
+        """
+        Runs the protocol once for every starting configuration, reusing this
+        protocol's Simulation and Context instead of creating one per run.
+
+        Each run starts from the periodic box vectors the Context had when
+        run_batch was called, so box changes from the NPT stages of one run do
+        not carry over into the next. All configurations must belong to the
+        System of this Simulation (e.g. conformers or replicas of one complex).
+
+        Args:
+            positions_list: Starting positions for each run, in any form accepted
+                by Context.setPositions.
+            barostat_frequency: The frequency for the Monte Carlo Barostat moves.
+                Defaults to 500.
+            fuse_equivalent: Passed on to run(). Defaults to False.
+
+        Returns:
+            The final openmm.State (with positions and velocities) of each run,
+            in the order of positions_list.
+        """
+
+        context = self.simulation.context
+        box_vectors = context.getState().getPeriodicBoxVectors()
+        states = []
+
+        for positions in positions_list:
+            context.setPeriodicBoxVectors(*box_vectors)
+            context.setPositions(positions)
+            self.run(
+                barostat_frequency=barostat_frequency,
+                fuse_equivalent=fuse_equivalent,
+            )
+            states.append(context.getState(getPositions=True, getVelocities=True))
+
+        return states
+
+    @classmethod
+    def run_many(
+        cls,
+        protocols: list["TwentyOneStepProtocol"],
+        max_workers: Optional[int] = None,
+        barostat_frequency: int = 500,
+        fuse_equivalent: bool = False,
+    ):
+        """
+        Runs several protocols concurrently, one per worker thread.
+
+        Each protocol drives its own Simulation and Context, and OpenMM releases
+        the GIL while integrating, so protocols bound to different devices (or
+        to the multi-threaded CPU platform) run in parallel.
+
+        Each protocol must also have its own System object. A running Context
+        reads the barostat settings from its System, so protocols sharing a
+        System would overwrite each other's barostat between stages. Build the
+        System separately for every Simulation (e.g. by calling createSystem or
+        deserializing it once per Simulation).
+
+        Args:
+            protocols: The protocols to run. Each must use its own Simulation and
+                its own System.
+            max_workers: The maximum number of threads. Defaults to one thread
+                per protocol.
+            barostat_frequency: The frequency for the Monte Carlo Barostat moves.
+                Defaults to 500.
+            fuse_equivalent: Passed on to run(). Defaults to False.
+
+        Raises:
+            TypeError: If an element of protocols is not a TwentyOneStepProtocol,
+                or if barostat_frequency is not an integer.
+            ValueError: If two protocols share the same Simulation or System, or
+                if max_workers is not positive.
+        """
+
+        if not isinstance(barostat_frequency, int):
+            raise TypeError(
+                "Argument 'barostat_frequency' should be an instance of int"
+            )
 
-        print("\n--- Protocol Completed Successfully ---")
+        for protocol in protocols:
+            if not isinstance(protocol, cls):
+                raise TypeError(
+                    f"Elements of 'protocols' should be instances of {cls.__name__}"
+                )
+
+        if len({id(protocol.simulation) for protocol in protocols}) != len(protocols):
+            raise ValueError("Protocols passed to run_many must not share a Simulation")
+
+        systems = {id(protocol.simulation.system) for protocol in protocols}
+        if len(systems) != len(protocols):
+            raise ValueError("Protocols passed to run_many must not share a System")
+
+        if not protocols:
+            return
+
+        if max_workers is None:
+            max_workers = len(protocols)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    protocol.run,
+                    barostat_frequency=barostat_frequency,
+                    fuse_equivalent=fuse_equivalent,
+                )
+                for protocol in protocols
+            ]
+
+            for future in futures:
+                future.result()